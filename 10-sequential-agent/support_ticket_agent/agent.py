@@ -5,16 +5,24 @@ This example demonstrates a support ticket processing pipeline that classifies,
 prioritizes, and recommends resolutions for customer support tickets.
 """
 
-from google.adk.agents import SequentialAgent
+from google.adk.agents import ParallelAgent, SequentialAgent
 
-from .sub_agents.classifier import ticket_classifier_agent
-from .sub_agents.priority import ticket_priority_agent
-from .sub_agents.recommender import resolution_recommender_agent
+from .sub_agents import (
+    resolution_recommender_agent,
+    ticket_classifier_agent,
+    ticket_priority_agent,
+)
+
+# --- 1. Classify and prioritize the ticket concurrently ---
+ticket_triage_agent = ParallelAgent(
+    name="TicketTriage",
+    sub_agents=[ticket_classifier_agent, ticket_priority_agent],
+)
 
-# Create the sequential agent
+# --- 2. Create the sequential agent: triage in parallel, then recommend ---
 root_agent = SequentialAgent(
     name="SupportTicketPipeline",
-    sub_agents=[ticket_classifier_agent, ticket_priority_agent, resolution_recommender_agent],
+    sub_agents=[ticket_triage_agent, resolution_recommender_agent],
     description="A pipeline that classifies, prioritizes, and recommends resolutions for support tickets",
 )
 
@@ -23,7 +31,7 @@ root_agent = SequentialAgent(
 ## How It Works
 1. The user submits a support ticket with their issue description
 2. The Ticket Classifier Agent categorizes the ticket (Technical, Billing, etc.)
-3. The classification is passed to the Priority Assessor Agent which determines urgency
-4. Both the classification and priority are passed to the Resolution Recommender Agent
-5. The final output provides the support team with a complete action plan
+   while the Priority Assessor Agent determines urgency from the same ticket
+3. Both the classification and priority are passed to the Resolution Recommender Agent
+4. The final output provides the support team with a complete action plan
 """
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""
+Structured Output Guard
+
+This module provides an after-model callback that makes sure a structured
+response matches the agent's output schema before ADK parses it. A reply cut
+off by max_output_tokens or carrying an unexpected value is repaired instead
+of failing the whole pipeline, and the repair is recorded in state so later
+agents do not treat the repaired labels as the model's own answer.
+"""
+
+import json
+import re
+from typing import Any, Callable, Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmResponse
+from google.genai import types
+from pydantic import BaseModel, ValidationError
+
+# --- Constants ---
+# temp: state lives only for the current invocation
+REPAIRED_KEY_PREFIX = "temp:output_repaired:"
+
+
+def was_repaired(state, agent_name: str) -> bool:
+    """
+    Check whether an agent's structured output was repaired in this invocation.
+
+    Args:
+        state: The session state
+        agent_name: The name of the agent that produced the output
+
+    Returns:
+        True if the output guard replaced the agent's reply
+    """
+    return bool(state.get(REPAIRED_KEY_PREFIX + agent_name))
+
+
+def _extract_string_field(text: str, field: str) -> Optional[str]:
+    """
+    Read a string field from JSON text that may be cut off mid-value.
+
+    Args:
+        text: The raw model output
+        field: The field name to look for
+
+    Returns:
+        The (possibly partial) field value, or None if it is not present
+    """
+    match = re.search(rf'"{re.escape(field)}"\s*:\s*"((?:[^"\\]|\\.)*)', text)
+    if not match:
+        return None
+    value = match.group(1)
+    # Drop a dangling escape left by truncation before decoding
+    if value.endswith("\\") and not value.endswith("\\\\"):
+        value = value[:-1]
+    try:
+        return json.loads(f'"{value}"')
+    except json.JSONDecodeError:
+        return None
+
+
+def repair_output(
+    text: str, output_schema: type[BaseModel], fallback: dict[str, Any]
+) -> BaseModel:
+    """
+    Build a valid schema instance from raw model output.
+
+    Every field the model produced that validates is kept; anything missing
+    or invalid is taken from the fallback values.
+
+    Args:
+        text: The raw model output
+        output_schema: The agent's output schema
+        fallback: A complete, valid set of values for the schema
+
+    Returns:
+        A validated instance of the output schema
+    """
+    values = dict(fallback)
+    for field in output_schema.model_fields:
+        extracted = _extract_string_field(text, field)
+        if extracted is None:
+            continue
+        try:
+            output_schema.model_validate({**values, field: extracted})
+        except ValidationError:
+            continue
+        values[field] = extracted
+    return output_schema.model_validate(values)
+
+
+def make_output_guard_callback(
+    output_schema: type[BaseModel],
+    fallback: dict[str, Any],
+    after: Optional[Callable[[CallbackContext, LlmResponse], Optional[LlmResponse]]] = None,
+) -> Callable[[CallbackContext, LlmResponse], Optional[LlmResponse]]:
+    """
+    Create an after-model callback that repairs invalid structured output.
+
+    Args:
+        output_schema: The agent's output schema
+        fallback: A complete, valid set of values used for unrecoverable fields
+        after: Another after-model callback to run on the original response
+
+    Returns:
+        A callback to pass as the agent's after_model_callback
+    """
+
+    def output_guard_callback(
+        callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> Optional[LlmResponse]:
+        """
+        Replace a response that does not match the output schema with a repaired one.
+
+        Args:
+            callback_context: Contains state and context information
+            llm_response: The LLM response received
+
+        Returns:
+            A repaired LlmResponse if the original was invalid, otherwise the
+            result of the chained callback
+        """
+        # The chained callback sees the original response, so a repaired
+        # reply is never cached as if the model had produced it
+        result = after(callback_context, llm_response) if after else None
+
+        if llm_response.partial or llm_response.error_code:
+            return result
+
+        parts = llm_response.content.parts if llm_response.content else None
+        text = "".join(part.text for part in parts if part.text) if parts else ""
+        try:
+            output_schema.model_validate_json(text)
+            return result
+        except ValidationError:
+            pass
+
+        repaired = repair_output(text, output_schema, fallback)
+        callback_context.state[REPAIRED_KEY_PREFIX + callback_context.agent_name] = True
+        print(f"[OUTPUT GUARD] Repaired invalid output from {callback_context.agent_name}")
+        return LlmResponse(
+            content=types.Content(
+                role="model", parts=[types.Part(text=repaired.model_dump_json())]
+            )
+        )
+
+    return output_guard_callback
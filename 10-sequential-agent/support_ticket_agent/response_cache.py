@@ -0,0 +1,188 @@
+"""
+Response Cache Callbacks
+
+This module provides a pair of model callbacks that cache LLM responses on disk.
+Repeated tickets skip the model call entirely and reuse the stored response.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Any, Callable, Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from pydantic import BaseModel, ValidationError
+
+# --- Constants ---
+CACHE_DB_PATH = os.getenv(
+    "RESPONSE_CACHE_DB",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "response_cache.db"),
+)
+
+# temp: state lives only for the current invocation, so a key left behind by a
+# failed model call is dropped with it instead of accumulating in this module
+PENDING_KEY_PREFIX = "temp:response_cache_key:"
+
+_connection = sqlite3.connect(CACHE_DB_PATH, check_same_thread=False)
+_connection.execute(
+    "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+)
+_connection.commit()
+
+
+def _schema_payload(schema: Any) -> Any:
+    """
+    Turn a response schema into JSON-serializable data for the cache key.
+
+    Args:
+        schema: A Pydantic model class, a genai Schema, or None
+
+    Returns:
+        The schema's JSON representation
+    """
+    if schema is None:
+        return None
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        return schema.model_json_schema()
+    if isinstance(schema, BaseModel):
+        return schema.model_dump(mode="json", exclude_none=True)
+    return str(schema)
+
+
+def _cache_key(llm_request: LlmRequest) -> str:
+    """
+    Build an exact-match key from everything that shapes the model's answer.
+
+    Args:
+        llm_request: The LLM request being sent
+
+    Returns:
+        A hex digest of the model name, system instruction, response schema,
+        generation settings and contents
+    """
+    config = llm_request.config
+    payload = {
+        "model": llm_request.model,
+        "system_instruction": str(config.system_instruction) if config else None,
+        # A schema or settings change must not replay entries made under the old ones
+        "response_schema": _schema_payload(config.response_schema) if config else None,
+        "generation_config": (
+            config.model_dump(
+                mode="json",
+                exclude_none=True,
+                exclude={"system_instruction", "response_schema"},
+            )
+            if config
+            else None
+        ),
+        "contents": [
+            content.model_dump(mode="json", exclude_none=True)
+            for content in llm_request.contents
+        ],
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=32).hexdigest()
+
+
+def _is_cacheable(
+    llm_response: LlmResponse, output_schema: Optional[type[BaseModel]]
+) -> bool:
+    """
+    Check that a response has content and, if required, matches the agent's schema.
+
+    ADK does not report why generation stopped, so a reply cut off by the token
+    limit is only detected for agents with an output schema, where the
+    truncated JSON fails validation. Free-text replies are cached as returned.
+
+    Args:
+        llm_response: The LLM response received
+        output_schema: The agent's output schema, if it has one
+
+    Returns:
+        True if the response is safe to replay for identical requests
+    """
+    if llm_response.error_code or not llm_response.content or not llm_response.content.parts:
+        return False
+
+    if output_schema:
+        text = "".join(part.text for part in llm_response.content.parts if part.text)
+        try:
+            output_schema.model_validate_json(text)
+        except ValidationError:
+            return False
+
+    return True
+
+
+def cache_lookup_callback(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """
+    Return a cached response for an identical request, skipping the model call.
+
+    Args:
+        callback_context: Contains state and context information
+        llm_request: The LLM request being sent
+
+    Returns:
+        The cached LlmResponse on a hit, otherwise None
+    """
+    key = _cache_key(llm_request)
+    row = _connection.execute(
+        "SELECT response FROM responses WHERE key = ?", (key,)
+    ).fetchone()
+    if row:
+        return LlmResponse.model_validate_json(row[0])
+
+    # Remember the key so the response can be stored once it arrives
+    callback_context.state[PENDING_KEY_PREFIX + callback_context.agent_name] = key
+    return None
+
+
+def make_cache_store_callback(
+    output_schema: Optional[type[BaseModel]] = None,
+) -> Callable[[CallbackContext, LlmResponse], Optional[LlmResponse]]:
+    """
+    Create an after-model callback that stores complete, valid responses.
+
+    Args:
+        output_schema: The agent's output schema; responses that fail it are not cached
+
+    Returns:
+        A callback to pass as the agent's after_model_callback
+    """
+
+    def cache_store_callback(
+        callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> Optional[LlmResponse]:
+        """
+        Store a completed model response under the key computed before the call.
+
+        Args:
+            callback_context: Contains state and context information
+            llm_response: The LLM response received
+
+        Returns:
+            None so the original response is used unchanged
+        """
+        # Streaming chunks are not cached, only the complete response
+        if llm_response.partial:
+            return None
+
+        state = callback_context.state
+        pending_key = PENDING_KEY_PREFIX + callback_context.agent_name
+        key = state.get(pending_key)
+        state[pending_key] = None
+
+        if key and _is_cacheable(llm_response, output_schema):
+            _connection.execute(
+                "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                (key, llm_response.model_dump_json(exclude_none=True)),
+            )
+            _connection.commit()
+
+        return None
+
+    return cache_store_callback
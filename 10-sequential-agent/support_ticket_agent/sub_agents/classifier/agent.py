@@ -5,29 +5,64 @@ This agent is responsible for classifying customer support tickets
 into appropriate categories/departments.
 """
 
+from typing import Literal
+
 from google.adk.agents import LlmAgent
+from google.genai import types
+from pydantic import BaseModel, Field
+
+from ...output_guard import make_output_guard_callback
+from ...response_cache import cache_lookup_callback, make_cache_store_callback
 
 # --- Constants ---
-GEMINI_MODEL = "gemini-2.0-flash"
+# Short one-of-N labels do not need the full flash model
+GEMINI_MODEL = "gemini-2.0-flash-lite"
+
+CLASSIFIER_INSTRUCTION = """You are a Support Ticket Classification AI.
+
+Analyze the customer support ticket and classify it into one of these categories:
+- Technical: Software bugs, errors, or technical malfunctions
+- Billing: Payment issues, subscription questions, refunds
+- Account: Login problems, account settings, security
+- Product: Product features, usage questions, compatibility
+- Other: Anything that doesn't fit the above categories
+
+IMPORTANT: Your response MUST be valid JSON with a "category" field set to
+one of the category names above and a brief "justification" field
+(under 120 characters).
+
+Example justification: 'User reports application crashes during startup'
+
+DO NOT include any explanations or additional text outside the JSON response.
+"""
+
+
+# --- Define Output Schema ---
+class Classification(BaseModel):
+    category: Literal["Technical", "Billing", "Account", "Product", "Other"] = Field(
+        description="The category the ticket belongs to."
+    )
+    justification: str = Field(
+        description="A brief justification for the chosen category, under 120 characters."
+    )
+
 
 # Create the classifier agent
 ticket_classifier_agent = LlmAgent(
     name="TicketClassifierAgent",
     model=GEMINI_MODEL,
-    instruction="""You are a Support Ticket Classification AI.
-    
-    Analyze the customer support ticket and classify it into one of these categories:
-    - Technical: Software bugs, errors, or technical malfunctions
-    - Billing: Payment issues, subscription questions, refunds
-    - Account: Login problems, account settings, security
-    - Product: Product features, usage questions, compatibility
-    - Other: Anything that doesn't fit the above categories
-    
-    Output ONLY the category name and a brief justification.
-    
-    Example output: 'Technical: User reports application crashes during startup'
-    Example output: 'Billing: Customer disputes recent charge on their account'
-    """,
+    instruction=CLASSIFIER_INSTRUCTION,
     description="Classifies support tickets into appropriate categories.",
+    output_schema=Classification,
     output_key="ticket_category",
+    generate_content_config=types.GenerateContentConfig(
+        max_output_tokens=64,
+        temperature=0.0,
+    ),
+    before_model_callback=cache_lookup_callback,
+    after_model_callback=make_output_guard_callback(
+        Classification,
+        fallback={"category": "Other", "justification": "Could not be determined from the model output"},
+        after=make_cache_store_callback(Classification),
+    ),
 )
\ No newline at end of file
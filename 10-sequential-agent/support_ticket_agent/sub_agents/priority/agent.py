@@ -5,33 +5,65 @@ This agent is responsible for assessing the priority level
 of customer support tickets.
 """
 
+from typing import Literal
+
 from google.adk.agents import LlmAgent
+from google.genai import types
+from pydantic import BaseModel, Field
+
+from ...output_guard import make_output_guard_callback
+from ...response_cache import cache_lookup_callback, make_cache_store_callback
 
 # --- Constants ---
-GEMINI_MODEL = "gemini-2.0-flash"
+# Short one-of-N labels do not need the full flash model
+GEMINI_MODEL = "gemini-2.0-flash-lite"
+
+PRIORITY_INSTRUCTION = """You are a Support Ticket Priority Assessment AI.
+
+Based on the ticket information, assign a priority level:
+- Critical: System-wide issues, security breaches, complete loss of service
+- High: Significant impact on business operations, no workaround available
+- Medium: Limited impact, workaround available, affecting multiple users
+- Low: Minor issues, cosmetic problems, affecting single user
+
+Consider factors like impact scope, business criticality, and urgency.
+
+IMPORTANT: Your response MUST be valid JSON with a "priority" field set to
+one of the priority levels above and a ONE sentence "justification" field
+(under 120 characters).
+
+Example justification: 'Complete system outage affecting all users'
+
+DO NOT include any explanations or additional text outside the JSON response.
+"""
+
+
+# --- Define Output Schema ---
+class Priority(BaseModel):
+    priority: Literal["Critical", "High", "Medium", "Low"] = Field(
+        description="The priority level assigned to the ticket."
+    )
+    justification: str = Field(
+        description="ONE sentence justification for the priority level, under 120 characters."
+    )
+
 
 # Create the priority agent
 ticket_priority_agent = LlmAgent(
     name="TicketPriorityAgent",
     model=GEMINI_MODEL,
-    instruction="""You are a Support Ticket Priority Assessment AI.
-    
-    Based on the ticket information and classification, assign a priority level:
-    - Critical: System-wide issues, security breaches, complete loss of service
-    - High: Significant impact on business operations, no workaround available
-    - Medium: Limited impact, workaround available, affecting multiple users
-    - Low: Minor issues, cosmetic problems, affecting single user
-    
-    Consider factors like impact scope, business criticality, and urgency.
-    
-    Output ONLY the priority level and ONE sentence justification.
-    
-    Ticket Category:
-    {ticket_category}
-    
-    Example output: 'Critical: Complete system outage affecting all users'
-    Example output: 'Low: Minor UI alignment issue on rarely used screen'
-    """,
+    instruction=PRIORITY_INSTRUCTION,
     description="Assesses priority level of support tickets.",
-    output_key="ticket_priority", 
+    output_schema=Priority,
+    output_key="ticket_priority",
+    generate_content_config=types.GenerateContentConfig(
+        max_output_tokens=64,
+        temperature=0.0,
+    ),
+    before_model_callback=cache_lookup_callback,
+    after_model_callback=make_output_guard_callback(
+        Priority,
+        fallback={"priority": "Medium", "justification": "Could not be determined from the model output"},
+        after=make_cache_store_callback(Priority),
+    ),
 )
\ No newline at end of file
@@ -5,33 +5,102 @@ This agent is responsible for recommending appropriate resolution steps
 based on ticket classification and priority.
 """
 
+import os
+from typing import Optional
+
 from google.adk.agents import LlmAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from google.adk.models.lite_llm import LiteLlm
+from google.genai import types
+
+from ...output_guard import was_repaired
+from ...response_cache import cache_lookup_callback, make_cache_store_callback
+from ..classifier import ticket_classifier_agent
+from ..priority import ticket_priority_agent
+from .playbook import lookup_recommendation
 
 # --- Constants ---
 GEMINI_MODEL = "gemini-2.0-flash"
 
+# Optional self-hosted OpenAI-compatible endpoint, e.g. vLLM started with
+# --speculative-model for faster long-form decoding. Unset it to fall back to Gemini.
+VLLM_API_BASE = os.getenv("VLLM_API_BASE")
+VLLM_MODEL = os.getenv("VLLM_MODEL", "openai/llama-3.1-70b-instruct")
+
+# Agents whose labels the playbook relies on
+TRIAGE_AGENT_NAMES = (ticket_classifier_agent.name, ticket_priority_agent.name)
+
+RECOMMENDER_INSTRUCTION = """You are a Support Resolution Recommendation AI.
+
+Based on the ticket classification and priority level, recommend appropriate
+next steps for resolving the customer's issue.
+
+For each category and priority combination, provide:
+1. Initial troubleshooting steps for the support agent
+2. Suggested response timeframe
+3. Escalation path if initial resolution fails
+
+Format your response as a complete recommendation to the support team.
+
+If a justification below says the label could not be determined, ignore that
+label and assess the category or priority from the ticket yourself.
+
+Ticket Category:
+{ticket_category}
+
+Ticket Priority:
+{ticket_priority}
+"""
+
+if VLLM_API_BASE:
+    model = LiteLlm(
+        model=VLLM_MODEL,
+        api_base=VLLM_API_BASE,
+        api_key=os.getenv("VLLM_API_KEY", "x"),
+    )
+else:
+    model = GEMINI_MODEL
+
+
+def playbook_callback(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """
+    Answer from the resolution playbook when it covers the ticket, otherwise
+    fall back to the response cache and then the model.
+
+    Args:
+        callback_context: Contains state and context information
+        llm_request: The LLM request being sent
+
+    Returns:
+        Optional LlmResponse to override model response
+    """
+    state = callback_context.state
+
+    # Repaired labels may not be the model's answer, so let the model see the ticket
+    if any(was_repaired(state, agent_name) for agent_name in TRIAGE_AGENT_NAMES):
+        return cache_lookup_callback(callback_context, llm_request)
+
+    recommendation = lookup_recommendation(
+        state.get("ticket_category"), state.get("ticket_priority")
+    )
+    if recommendation:
+        return LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=recommendation)])
+        )
+
+    return cache_lookup_callback(callback_context, llm_request)
+
+
 # Create the recommender agent
 resolution_recommender_agent = LlmAgent(
     name="ResolutionRecommenderAgent",
-    model=GEMINI_MODEL,
-    instruction="""You are a Support Resolution Recommendation AI.
-    
-    Based on the ticket classification and priority level, recommend appropriate
-    next steps for resolving the customer's issue.
-    
-    Ticket Category:
-    {ticket_category}
-    
-    Ticket Priority:
-    {ticket_priority}
-    
-    For each category and priority combination, provide:
-    1. Initial troubleshooting steps for the support agent
-    2. Suggested response timeframe
-    3. Escalation path if initial resolution fails
-    
-    Format your response as a complete recommendation to the support team.
-    """,
+    model=model,
+    instruction=RECOMMENDER_INSTRUCTION,
     description="Recommends resolution steps based on ticket classification and priority.",
-    output_key="resolution_recommendation", 
+    output_key="resolution_recommendation",
+    before_model_callback=playbook_callback,
+    after_model_callback=make_cache_store_callback(),
 )
\ No newline at end of file
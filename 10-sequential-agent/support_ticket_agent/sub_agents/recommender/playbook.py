@@ -0,0 +1,101 @@
+"""
+Resolution Playbook
+
+Canned resolution recommendations for common ticket category and priority
+combinations. A hit lets the recommender answer without calling the model.
+"""
+
+import json
+from typing import Optional
+
+# Initial troubleshooting steps and owning team for each category.
+# "Other" is left out on purpose so unusual tickets still get an LLM answer.
+_CATEGORY_STEPS = {
+    "Technical": (
+        [
+            "Collect the exact error message, app version, OS/browser and steps to reproduce",
+            "Check the status page and recent deployments for related incidents",
+            "Ask the customer to clear cache, update to the latest version and retry",
+        ],
+        "Engineering on-call",
+    ),
+    "Billing": (
+        [
+            "Verify the customer's identity and locate the invoice or charge in question",
+            "Compare the charge against the subscription plan and billing history",
+            "Explain the charge or prepare a refund/credit request if it is incorrect",
+        ],
+        "Billing operations",
+    ),
+    "Account": (
+        [
+            "Verify the customer's identity before making any account changes",
+            "Check for lockouts, pending verification or recent security events",
+            "Guide the customer through password reset or settings recovery",
+        ],
+        "Account security",
+    ),
+    "Product": (
+        [
+            "Confirm the customer's plan and which feature they are using",
+            "Share the relevant documentation or how-to guide",
+            "Log the request as feedback if the feature is missing or limited",
+        ],
+        "Product specialists",
+    ),
+}
+
+# Response timeframe and escalation trigger for each priority.
+_PRIORITY_HANDLING = {
+    "Critical": ("Respond within 15 minutes and provide updates every hour", "immediately if not resolved within 1 hour"),
+    "High": ("Respond within 1 hour", "if not resolved within 4 hours"),
+    "Medium": ("Respond within 1 business day", "if not resolved within 3 business days"),
+    "Low": ("Respond within 3 business days", "if not resolved within 1 week"),
+}
+
+
+def _format_recommendation(category: str, priority: str) -> str:
+    steps, team = _CATEGORY_STEPS[category]
+    timeframe, escalation = _PRIORITY_HANDLING[priority]
+    numbered_steps = "\n".join(f"   {i}. {step}" for i, step in enumerate(steps, start=1))
+    return (
+        f"Recommendation for a {priority} priority {category} ticket:\n\n"
+        f"1. Initial troubleshooting steps:\n{numbered_steps}\n\n"
+        f"2. Suggested response timeframe: {timeframe}.\n\n"
+        f"3. Escalation path: Escalate to {team} {escalation}."
+    )
+
+
+PLAYBOOK: dict[tuple[str, str], str] = {
+    (category, priority): _format_recommendation(category, priority)
+    for category in _CATEGORY_STEPS
+    for priority in _PRIORITY_HANDLING
+}
+
+
+def _label(value, field: str) -> Optional[str]:
+    """Read a justified label from a classifier/priority output stored in state."""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return None
+    # A label without a justification was not reasoned about by the model
+    if isinstance(value, dict) and value.get("justification"):
+        return value.get(field)
+    return None
+
+
+def lookup_recommendation(ticket_category, ticket_priority) -> Optional[str]:
+    """
+    Look up a canned recommendation for the ticket's category and priority.
+
+    Args:
+        ticket_category: The classifier output stored in state
+        ticket_priority: The priority output stored in state
+
+    Returns:
+        The canned recommendation, or None if the combination is not covered
+    """
+    key = (_label(ticket_category, "category"), _label(ticket_priority, "priority"))
+    return PLAYBOOK.get(key)
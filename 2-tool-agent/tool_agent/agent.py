@@ -1,8 +1,21 @@
+import random
+
 from google.adk.agents import Agent
 from google.adk.tools import google_search
 
 from google.adk.tools import FunctionTool
 
+WEATHER_CONDITIONS = ["Sunny", "Partly Cloudy", "Cloudy", "Rainy", "Thunderstorms", "Snowy", "Windy"]
+TEMPERATURE_RANGES = {
+    "Sunny": (75, 95),
+    "Partly Cloudy": (65, 85),
+    "Cloudy": (60, 75),
+    "Rainy": (55, 70),
+    "Thunderstorms": (60, 80),
+    "Snowy": (20, 35),
+    "Windy": (50, 65)
+}
+
 def weather_forecast(location: str, days: int = 3) -> str:
     """
     Get a simulated weather forecast for a location.
@@ -14,30 +27,19 @@ def weather_forecast(location: str, days: int = 3) -> str:
     Returns:
         A simulated weather forecast as a string
     """
-    import random
-    
-    weather_conditions = ["Sunny", "Partly Cloudy", "Cloudy", "Rainy", "Thunderstorms", "Snowy", "Windy"]
-    temperature_ranges = {
-        "Sunny": (75, 95),
-        "Partly Cloudy": (65, 85),
-        "Cloudy": (60, 75),
-        "Rainy": (55, 70),
-        "Thunderstorms": (60, 80),
-        "Snowy": (20, 35),
-        "Windy": (50, 65)
-    }
+    # Draw every day's condition in a single call
+    conditions = random.choices(WEATHER_CONDITIONS, k=days)
     
-    forecast = f"Weather forecast for {location} for the next {days} days:\n\n"
+    forecast = "".join(
+        f"Day {day}: {condition}, {random.randint(*TEMPERATURE_RANGES[condition])}°F\n"
+        for day, condition in enumerate(conditions, start=1)
+    )
     
-    for day in range(1, days + 1):
-        condition = random.choice(weather_conditions)
-        temp_range = temperature_ranges[condition]
-        temp = random.randint(temp_range[0], temp_range[1])
-        
-        forecast += f"Day {day}: {condition}, {temp}°F\n"
-    
-    return forecast
+    return f"Weather forecast for {location} for the next {days} days:\n\n{forecast}"
+
 
+# Wrap the function once at import so the agent reuses the same tool instance
+weather_forecast_tool = FunctionTool(func=weather_forecast)
 
 
 root_agent = Agent(
@@ -50,7 +52,7 @@ root_agent = Agent(
     - weather_forecast: Get a simulated weather forecast for a location
     """,
     # tools =[google_search],
-    tools = [weather_forecast],
+    tools = [weather_forecast_tool],
 )
 
 ## Only pass in one built in tool at a time and we can't pass in built in tool and custom tool both at the same time
\ No newline at end of file
@@ -1,5 +1,6 @@
 import uuid
 from dotenv import load_dotenv
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
@@ -43,28 +44,39 @@ user_messages = [
     "Confirm my order."
 ]
 
+# Stream partial responses so text is printed as soon as it is generated
+run_config = RunConfig(streaming_mode=StreamingMode.SSE)
+
+# Track session state from the events' state deltas instead of re-reading the session
+final_state = dict(stateful_session.state)
+
 # Process each user message
 for user_input in user_messages:
     print(f"\nUser: {user_input}")
     new_message = types.Content(role="user", parts=[types.Part(text=user_input)])
     
     # Run the agent with the user message
+    print("Agent: ", end="", flush=True)
+    streamed = False
     for event in runner.run(
         user_id=USER_ID,
         session_id=SESSION_ID,
         new_message=new_message,
+        run_config=run_config,
     ):
-        if event.is_final_response():
-            if event.content and event.content.parts:
-                print(f"Agent: {event.content.parts[0].text}")
+        if event.actions and event.actions.state_delta:
+            final_state.update(event.actions.state_delta)
+        if event.partial:
+            if event.content and event.content.parts and event.content.parts[0].text:
+                print(event.content.parts[0].text, end="", flush=True)
+                streamed = True
+        elif event.is_final_response():
+            # The final event repeats the full text, so only print it if nothing was streamed
+            if not streamed and event.content and event.content.parts:
+                print(event.content.parts[0].text, end="")
+            print()
 
-# Retrieve and display the updated session state
+# Display the updated session state
 print("\n==== Final Session State ====")
-session = session_service_stateful.get_session(
-    app_name=APP_NAME,
-    user_id=USER_ID,
-    session_id=SESSION_ID
-)
-
-for key, value in session.state.items():
+for key, value in final_state.items():
     print(f"{key}: {value}")
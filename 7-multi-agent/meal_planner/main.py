@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from dotenv import load_dotenv
 from google.adk.runners import Runner
@@ -12,18 +13,9 @@ session_service = InMemorySessionService()
 
 APP_NAME = "MealPlannerBot"
 USER_ID = "user_meal_planner"
-SESSION_ID = str(uuid.uuid4())
 
-# Create a new session
-session_service.create_session(
-    app_name=APP_NAME,
-    user_id=USER_ID,
-    session_id=SESSION_ID,
-    state={}
-)
-
-print("CREATED NEW SESSION:")
-print(f"\tSession ID: {SESSION_ID}")
+# Upper bound on meal plan requests in flight at once
+MAX_CONCURRENT_REQUESTS = 32
 
 runner = Runner(
     agent=root_agent,
@@ -31,27 +23,56 @@ runner = Runner(
     session_service=session_service,
 )
 
-# Simulate user input
-user_input = "Provide a shopping list for healthy, carb-free vegetarian meals for the next 3 days."
+# Simulate incoming user requests
+user_inputs = [
+    "Provide a shopping list for healthy, carb-free vegetarian meals for the next 3 days.",
+    "Create a 7 days keto meal plan.",
+]
 
-new_message = types.Content(role="user", parts=[types.Part(text=user_input)])
 
-for event in runner.run(
-    user_id=USER_ID,
-    session_id=SESSION_ID,
-    new_message=new_message,
-):
-    if event.is_final_response():
-        if event.content and event.content.parts:
-            print(f"Final Response: {event.content.parts[0].text}")
+async def handle(user_input, semaphore):
+    """Run one meal plan request in its own session."""
+    async with semaphore:
+        session_id = str(uuid.uuid4())
+
+        # Create a new session
+        session_service.create_session(
+            app_name=APP_NAME,
+            user_id=USER_ID,
+            session_id=session_id,
+            state={}
+        )
+
+        print("CREATED NEW SESSION:")
+        print(f"\tSession ID: {session_id}")
+
+        new_message = types.Content(role="user", parts=[types.Part(text=user_input)])
+
+        # Track session state from the events' state deltas instead of re-reading the session
+        final_state = {}
+
+        async for event in runner.run_async(
+            user_id=USER_ID,
+            session_id=session_id,
+            new_message=new_message,
+        ):
+            if event.actions and event.actions.state_delta:
+                final_state.update(event.actions.state_delta)
+            if event.is_final_response():
+                if event.content and event.content.parts:
+                    print(f"[{session_id}] Final Response: {event.content.parts[0].text}")
+
+        # Display the updated session state
+        print(f"\n==== Final Session State ({session_id}) ====")
+        for key, value in final_state.items():
+            print(f"{key}: {value}")
+
+
+async def main_async():
+    # Fire every request concurrently, capped by the semaphore
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    await asyncio.gather(*(handle(user_input, semaphore) for user_input in user_inputs))
 
-# Retrieve and display the updated session state
-print("\n==== Final Session State ====")
-session = session_service.get_session(
-    app_name=APP_NAME,
-    user_id=USER_ID,
-    session_id=SESSION_ID
-)
 
-for key, value in session.state.items():
-    print(f"{key}: {value}")
+if __name__ == "__main__":
+    asyncio.run(main_async())
@@ -0,0 +1,15 @@
+import os
+
+import httpx
+import litellm
+from google.adk.models.lite_llm import LiteLlm
+
+# Route every LiteLLM call in this process through one pooled, keep-alive client
+# so concurrent sub-agent calls reuse open connections instead of new TLS handshakes
+litellm.aclient_session = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+    timeout=httpx.Timeout(60.0, connect=5.0),
+)
+
+# Single model instance shared by all meal planner sub-agents
+model = LiteLlm(model="openai/gpt-4.1", api_key=os.getenv("OPENAI_API_KEY"))
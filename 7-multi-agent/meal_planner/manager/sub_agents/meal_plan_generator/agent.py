@@ -1,12 +1,13 @@
-import os
 from google.adk.agents import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
+
+from ...shared_model import model
 
 meal_plan_generator_agent = LlmAgent(
-    model=LiteLlm(model="openai/gpt-4.1", api_key=os.getenv("OPENAI_API_KEY")),
+    model=model,
     name="meal_plan_generator_agent",
     instruction=(
-        "Generate a 7-day meal plan based on the user's dietary preferences and nutritional goals."
+        "Generate a 7-day meal plan based on the user's dietary preferences and nutritional goals.\n\n"
+        "User profile:\n{user_profile}"
     ),
     output_key="meal_plan"
 )
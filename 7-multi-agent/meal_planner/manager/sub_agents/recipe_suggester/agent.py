@@ -1,12 +1,13 @@
-import os
 from google.adk.agents import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
+
+from ...shared_model import model
 
 recipe_suggester_agent = LlmAgent(
-    model=LiteLlm(model="openai/gpt-4.1", api_key=os.getenv("OPENAI_API_KEY")),
+    model=model,
     name="recipe_suggester_agent",
     instruction=(
-        "Suggest recipes for each meal in the plan, considering the user's available ingredients."
+        "Suggest recipes for each meal in the plan, considering the user's available ingredients.\n\n"
+        "Meal plan:\n{meal_plan}"
     ),
     output_key="recipes"
 )
@@ -1,12 +1,13 @@
-import os
 from google.adk.agents import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
+
+from ...shared_model import model
 
 shopping_list_agent = LlmAgent(
-    model=LiteLlm(model="openai/gpt-4.1", api_key=os.getenv("OPENAI_API_KEY")),
+    model=model,
     name="shopping_list_agent",
     instruction=(
-        "Create a shopping list for ingredients not available at home, based on the meal plan."
+        "Create a shopping list for ingredients not available at home, based on the meal plan.\n\n"
+        "Meal plan:\n{meal_plan}"
     ),
     output_key="shopping_list"
 )
@@ -1,12 +1,13 @@
-import os
 from google.adk.agents import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
+
+from ...shared_model import model
 
 user_profile_agent = LlmAgent(
-    model=LiteLlm(model="openai/gpt-4.1", api_key=os.getenv("OPENAI_API_KEY")),
+    model=model,
     name="user_profile_agent",
     instruction=(
-        "Collect and update user dietary preferences, restrictions, and nutritional goals."
+        "Collect and update user dietary preferences, restrictions, and nutritional goals "
+        "from the user's request."
     ),
     output_key="user_profile"
 )
@@ -1,13 +1,17 @@
 from google.adk.agents import Agent
+from google.adk.tools import FunctionTool
 
 from adk_bot.prompt import ROOT_AGENT_INSTRUCTION
 
 from adk_bot.tools import count_characters
 
+# Wrap the function once at import so the agent reuses the same tool instance
+count_characters_tool = FunctionTool(func=count_characters)
+
 root_agent = Agent(
     name="adk_bot",
     model="gemini-2.0-flash",
     description="A bot that shortens messages while maintaining their core meaning",
     instruction=ROOT_AGENT_INSTRUCTION,
-    tools=[count_characters],
+    tools=[count_characters_tool],
 )
\ No newline at end of file